@@ -1,4 +1,4 @@
 """Access to Modelo 720 declaration parsing and validation."""
 
-from .declaracion import Declaration, Valoracion, DeclarationValidationError #noqa: F401
+from .declaracion import Declaration, Valoracion, DeclarationValidationError, validar_nif #noqa: F401
 from .parser import Parser, CSV720Error #noqa: F401
\ No newline at end of file
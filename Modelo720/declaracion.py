@@ -1,37 +1,83 @@
-"""This module provides data structures and validation logic for Modelo 720 declarations."""
+"""This module provides data structures and validation logic for Modelo 720 declarations.
 
+JSON input should be loaded with Declaration.from_json rather than through
+json.loads followed by model_validate.
+"""
+
+import io
+import sys
 from enum import Enum
 
+from functools import lru_cache
 from decimal import Decimal
 from datetime import date
-from typing import List, Optional, Literal
+from typing import Iterable, List, Optional, Literal, Union
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    Field,
+    TypeAdapter,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
+from typing_extensions import Annotated
 
 
 MODEL_CODE = "720"
 
 
+# Tabla de letras de control del DNI/NIE, indexada por número % 23
+_NIF_TABLE = b"TRWAGMYFPDXBNJZSQVHLCKE"
+# Sustitución de la letra inicial del NIE por su dígito equivalente
+_NIE_MAP = str.maketrans("XYZ", "012")
+
+
+def _is_ascii_digits(s: str) -> bool:
+    """Return True if ``s`` is non-empty and made only of ASCII digits 0-9."""
+    return s.isascii() and s.isdigit()
+
+
 def validar_nif(nif: str) -> bool:
     """Valida un DNI español (8 números + 1 letra) o NIE (1 letra + 7 números + 1 letra)."""
     if not nif:
         return False
-    nif = nif.upper().strip()
-    if len(nif) == 9 and nif[:8].isdigit():
-        # Caso DNI estándar
-        numero = int(nif[:8])
-        letra_control = nif[8]
-        tabla = "TRWAGMYFPDXBNJZSQVHLCKE"
-        return tabla[numero % 23] == letra_control
-    if len(nif) == 9 and nif[0] in "XYZ" and nif[1:8].isdigit():
-        # Caso NIE
-        reemplazo = {"X": "0", "Y": "1", "Z": "2"}
-        num_nie = reemplazo[nif[0]] + nif[1:8]
-        letra_control = nif[8]
-        tabla = "TRWAGMYFPDXBNJZSQVHLCKE"
-        return tabla[int(num_nie) % 23] == letra_control
-
-    return False
+    return _validar_nif_normalizado(nif.upper().strip())
+
+
+@lru_cache(maxsize=100_000)
+def _validar_nif_normalizado(nif: str) -> bool:
+    """Valida un NIF ya normalizado (mayúsculas y sin espacios).
+
+    Los resultados se memorizan: una declaración repite el mismo NIF del
+    declarante en todos sus registros de detalle.
+    """
+    if len(nif) != 9:
+        return False
+    # Para un NIE, la letra inicial se sustituye por su dígito (X=0, Y=1, Z=2)
+    core = nif[0].translate(_NIE_MAP) + nif[1:8] if nif[0] in "XYZ" else nif[:8]
+    if not _is_ascii_digits(core):
+        return False
+    return _NIF_TABLE[int(core) % 23] == ord(nif[8])
+
+
+def _validar_campo_nif(v: str, info: ValidationInfo) -> str:
+    """Validate a NIF field and return it normalized."""
+    nif = v.upper().strip()
+    if not nif or not _validar_nif_normalizado(nif):
+        raise ValueError(f"Formato de NIF inválido para {info.field_name}: {v}")
+    return nif
+
+
+def _validar_campo_nif_opcional(v: str, info: ValidationInfo) -> str:
+    """Validate a NIF field that may be left empty."""
+    return _validar_campo_nif(v, info) if v else v
+
+
+# NIF obligatorio y NIF que puede quedar vacío, validados y normalizados
+NIF = Annotated[str, AfterValidator(_validar_campo_nif)]
+NIFOpcional = Annotated[str, AfterValidator(_validar_campo_nif_opcional)]
 
 
 class DeclarationValidationError(Exception):
@@ -66,6 +112,12 @@ class Valoracion(BaseModel):
 
     model_config = {"arbitrary_types_allowed": True}
 
+    @property
+    def importe_cents(self) -> Union[int, Decimal]:
+        """Amount in cents; an int unless importe has more than two decimals."""
+        cents = self.importe.scaleb(2)
+        return int(cents) if cents == cents.to_integral_value() else cents
+
 
 class Header720(BaseModel):
     """Represents a header record in the Modelo 720 declaration."""
@@ -76,7 +128,7 @@ class Header720(BaseModel):
         description="Modelo declaración (constante 720)",
     )
     ejercicio: int = Field(description="Ejercicio fiscal")
-    nif_declarante: str = Field(
+    nif_declarante: NIF = Field(
         max_length=9,
         description="N.I.F. del declarante",
     )
@@ -120,21 +172,11 @@ class Header720(BaseModel):
         "saldo medio último trimestre"
     )
 
-    model_config = {"arbitrary_types_allowed": True}
-
-    @field_validator("nif_declarante")
-    @classmethod
-    def validate_nif_declarante(cls, v):
-        """Validate NIF format for nif_declarante."""
-        if not validar_nif(v):
-            raise ValueError(f"Formato de NIF inválido para nif_declarante: {v}")
-        return v.upper().strip()
-
     @field_validator("numero_identificativo")
     @classmethod
     def validate_numero_identificativo(cls, v):
         """Validate numero_identificativo format."""
-        if not v.isdigit() or len(v) != 13:
+        if len(v) != 13 or not _is_ascii_digits(v):
             raise ValueError("El número identificativo debe tener 13 dígitos")
         if not v.startswith("720"):
             raise ValueError("El número identificativo debe comenzar con 720")
@@ -158,7 +200,7 @@ class Header720(BaseModel):
                     "complementarias o sustitutivas"
                 )
             if (
-                not self.numero_identificativo_anterior.isdigit()
+                not _is_ascii_digits(self.numero_identificativo_anterior)
                 or len(self.numero_identificativo_anterior) != 13
             ):
                 raise ValueError(
@@ -179,15 +221,15 @@ class Detalle720(BaseModel):
         description="Modelo de la declaración (constante 720)",
     )
     ejercicio: int = Field(description="Ejercicio fiscal")
-    nif_declarante: str = Field(
+    nif_declarante: NIF = Field(
         max_length=9,
         description="NIF del declarante",
     )
-    nif_declarado: str = Field(
+    nif_declarado: NIFOpcional = Field(
         max_length=9,
         description="NIF de la persona declarada",
     )
-    nif_representante: str = Field(
+    nif_representante: NIFOpcional = Field(
         max_length=9,
         description="NIF del representante legal",
     )
@@ -293,153 +335,210 @@ class Detalle720(BaseModel):
         description="Porcentaje de participación (parte decimal)"
     )
 
-    model_config = {"arbitrary_types_allowed": True}
-
-    @field_validator("nif_declarante")
-    @classmethod
-    def validate_nif_declarante(cls, v):
-        """Validate NIF format for nif_declarante."""
-        if not validar_nif(v):
-            raise ValueError(f"Formato de NIF inválido para nif_declarante: {v}")
-        return v.upper().strip()
-
-    @field_validator("nif_declarado")
-    @classmethod
-    def validate_nif_declarado(cls, v):
-        """Validate NIF format for nif_declarado."""
-        if v and not validar_nif(v):
-            raise ValueError(f"Formato de NIF inválido para nif_declarado: {v}")
-        return v.upper().strip() if v else v
-
-    @field_validator("nif_representante")
-    @classmethod
-    def validate_nif_representante(cls, v):
-        """Validate NIF format for nif_representante."""
-        if v and not validar_nif(v):
-            raise ValueError(f"Formato de NIF inválido para nif_representante: {v}")
-        return v.upper().strip() if v else v
-
     @model_validator(mode="after")
     def validate_detail_rules(self):
         """Validate business rules for detail records."""
-        # Subclave validation based on clave_tipo_bien
-        if self.clave_tipo_bien == ClaveBien.I and self.subclave != 0:
-            raise ValueError("subclave must be 0 for clave_tipo_bien 'I'")
-
-        if self.clave_tipo_bien == ClaveBien.C and self.subclave not in (1, 2, 3, 4, 5):
-            raise ValueError(
-                "subclave debe ser 1-5 para clave_tipo_bien 'C' (bank accounts)"
-            )
+        regla = _regla_detalle_incumplida(self)
+        if regla is not None:
+            raise ValueError(_RULE_MSG[regla])
+        return self
 
-        if self.clave_tipo_bien == ClaveBien.V and self.subclave not in (1, 2, 3):
-            raise ValueError(
-                "subclave debe ser 1-3 para clave_tipo_bien 'V' (securities)"
-            )
 
-        if self.clave_tipo_bien == ClaveBien.S and self.subclave not in (1, 2):
-            raise ValueError(
-                "subclave debe ser 1-2 para clave_tipo_bien 'S' (insurance)"
-            )
-        if self.clave_tipo_bien == ClaveBien.B and self.subclave not in (1, 2, 3, 4, 5):
-            raise ValueError(
-                "subclave debe ser 1-5 para clave_tipo_bien 'B' (real estate)"
-            )
-
-        # tipo_derecho_real_inmueble only for B with subclave 5
-        if self.clave_tipo_bien == ClaveBien.B and self.subclave == 5:
-            if (
-                not self.tipo_derecho_real_inmueble
-                or not self.tipo_derecho_real_inmueble.strip()
-            ):
-                raise ValueError(
-                    "tipo_derecho_real_inmueble es obligatorio cuando "
-                    "clave_tipo_bien es 'B' y subclave es 5"
-                )
+# Valores admitidos para clave_ident_cuenta (bien 'C') y
+# clave_tipo_bien_inmueble (bien 'B'); en blanco también es válido
+_VALID_IDENT_CUENTA = frozenset({"I", "O", " ", ""})
+_VALID_TIPO_INMUEBLE = frozenset({"U", "R", " ", ""})
+# Valores admitidos para los bienes 'V' e 'I'
+_VALID_CLAVE_REPR_VALORES = frozenset({"A", "B"})
+_VALID_CLAVE_IDENTIFICACION = frozenset({1, 2})
+
+
+# Miembros de los enumerados usados en las reglas de detalle
+_I, _C, _V, _S, _B = ClaveBien.I, ClaveBien.C, ClaveBien.V, ClaveBien.S, ClaveBien.B
+_ORIGEN_C = Origen.C
+_VI = frozenset({_V, _I})
+
+# Subclaves admitidas por clave_tipo_bien, con la regla que se incumple si no
+_SUBCLAVES_VALIDAS = {
+    _I: (frozenset({0}), "subclave_I"),
+    _C: (frozenset({1, 2, 3, 4, 5}), "subclave_C"),
+    _V: (frozenset({1, 2, 3}), "subclave_V"),
+    _S: (frozenset({1, 2}), "subclave_S"),
+    _B: (frozenset({1, 2, 3, 4, 5}), "subclave_B"),
+}
+
+# Mensajes de error de las reglas de negocio de los registros de detalle
+_RULE_MSG = {
+    "subclave_I": "subclave must be 0 for clave_tipo_bien 'I'",
+    "subclave_C": "subclave debe ser 1-5 para clave_tipo_bien 'C' (bank accounts)",
+    "subclave_V": "subclave debe ser 1-3 para clave_tipo_bien 'V' (securities)",
+    "subclave_S": "subclave debe ser 1-2 para clave_tipo_bien 'S' (insurance)",
+    "subclave_B": "subclave debe ser 1-5 para clave_tipo_bien 'B' (real estate)",
+    "origen_C_fecha": "origen 'C' requires fecha_extincion",
+    "ident_cuenta_C": (
+        "clave_ident_cuenta debe ser 'I', 'O', o en blanco para clave_tipo_bien 'C'"
+    ),
+    "derecho_real_B": (
+        "tipo_derecho_real_inmueble es obligatorio cuando "
+        "clave_tipo_bien es 'B' y subclave es 5"
+    ),
+    "tipo_inmueble_B": (
+        "clave_tipo_bien_inmueble debe ser 'U', 'R', o en blanco para clave_tipo_bien 'B'"
+    ),
+    "tipo_inmueble_B_obligatorio": (
+        "clave_tipo_bien_inmueble es obligatorio para clave_tipo_bien 'B'"
+    ),
+    "entidad_B": "identificacion_entidad debe estar en blanco para clave_tipo_bien 'B'",
+    "nif_entidad_B": (
+        "nif_entidad_pais_residencia debe estar en blanco para clave_tipo_bien 'B'"
+    ),
+    "clave_identificacion_VI": (
+        "clave_identificacion debe ser 1 o 2 para clave_tipo_bien 'V' o 'I'"
+    ),
+    "identificacion_valores_VI": (
+        "identificacion_valores es obligatorio para clave_tipo_bien 'V' o 'I'"
+    ),
+    "clave_repr_valores_VI": (
+        "clave_repr_valores debe ser 'A' o 'B' para clave_tipo_bien 'V' o 'I'"
+    ),
+    "clave_identificacion_otros": (
+        "clave_identificacion debe ser 0 para clave_tipo_bien distinto de 'V' o 'I'"
+    ),
+    "identificacion_valores_otros": (
+        "identificacion_valores debe estar en blanco para "
+        "clave_tipo_bien distinto de 'V' o 'I'"
+    ),
+}
+
+
+def _regla_detalle_incumplida(d: "Detalle720") -> Optional[str]:
+    """Return the key in _RULE_MSG of the first business rule a detail violates.
+
+    Rules are checked in the same order as the original per-field checks,
+    so a record breaking several of them reports the same one as before.
+    Returns None when the record satisfies every rule.
+    """
+    # str-mixin members hash and compare equal to their plain values
+    clave = d.clave_tipo_bien
+
+    # Subclave validation based on clave_tipo_bien
+    subclave = d.subclave
+    allowed, regla = _SUBCLAVES_VALIDAS[clave]
+    if subclave not in allowed:
+        return regla
+
+    # tipo_derecho_real_inmueble only for B with subclave 5
+    if (
+        clave == _B
+        and subclave == 5
+        and (
+            not d.tipo_derecho_real_inmueble or not d.tipo_derecho_real_inmueble.strip()
+        )
+    ):
+        return "derecho_real_B"
 
-        # Extinction date validation
-        if self.origen == Origen.C and self.fecha_extincion is None:
-            raise ValueError("origen 'C' requires fecha_extincion")
+    # Extinction date validation
+    if d.origen == _ORIGEN_C and d.fecha_extincion is None:
+        return "origen_C_fecha"
 
+    if clave == _C:
         # Account identification validation
-        if self.clave_tipo_bien == ClaveBien.C and self.clave_ident_cuenta not in (
-            "I",
-            "O",
-            " ",
-            "",
-        ):
-            raise ValueError(
-                "clave_ident_cuenta debe ser 'I', 'O', o en blanco para clave_tipo_bien 'C'"
-            )
+        if d.clave_ident_cuenta not in _VALID_IDENT_CUENTA:
+            return "ident_cuenta_C"
 
+    elif clave == _B:
         # Real estate type validation
-        if (
-            self.clave_tipo_bien == ClaveBien.B
-            and self.clave_tipo_bien_inmueble not in ("U", "R", " ", "")
-        ):
-            raise ValueError(
-                "clave_tipo_bien_inmueble debe ser 'U', 'R', o en blanco para clave_tipo_bien 'B'"
-            )
+        if d.clave_tipo_bien_inmueble not in _VALID_TIPO_INMUEBLE:
+            return "tipo_inmueble_B"
 
         # Real estate requires clave_tipo_bien_inmueble
-        if self.clave_tipo_bien == ClaveBien.B:
-            if (
-                not self.clave_tipo_bien_inmueble
-                or not self.clave_tipo_bien_inmueble.strip()
-            ):
-                raise ValueError(
-                    "clave_tipo_bien_inmueble es obligatorio para clave_tipo_bien 'B'"
-                )
+        if not d.clave_tipo_bien_inmueble or not d.clave_tipo_bien_inmueble.strip():
+            return "tipo_inmueble_B_obligatorio"
 
+    if clave in _VI:
         # clave_identificacion only for V or I
-        if self.clave_tipo_bien in (ClaveBien.V, ClaveBien.I):
-            if self.clave_identificacion not in (1, 2):
-                raise ValueError(
-                    "clave_identificacion debe ser 1 o 2 para clave_tipo_bien 'V' o 'I'"
-                )
-        else:
-            if self.clave_identificacion != 0:
-                raise ValueError(
-                    "clave_identificacion debe ser 0 para clave_tipo_bien distinto de 'V' o 'I'"
-                )
+        if d.clave_identificacion not in _VALID_CLAVE_IDENTIFICACION:
+            return "clave_identificacion_VI"
 
         # identificacion_valores only for V or I
-        if self.clave_tipo_bien in (ClaveBien.V, ClaveBien.I):
-            if (
-                not self.identificacion_valores
-                or not self.identificacion_valores.strip()
-            ):
-                raise ValueError(
-                    "identificacion_valores es obligatorio para clave_tipo_bien 'V' o 'I'"
-                )
-        else:
-            if self.identificacion_valores and self.identificacion_valores.strip():
-                raise ValueError(
-                    "identificacion_valores debe estar en blanco para "
-                    "clave_tipo_bien distinto de 'V' o 'I'"
-                )
+        if not d.identificacion_valores or not d.identificacion_valores.strip():
+            return "identificacion_valores_VI"
 
         # clave_repr_valores and numero_valores only for V or I
-        if self.clave_tipo_bien in (ClaveBien.V, ClaveBien.I):
-            if not self.clave_repr_valores or self.clave_repr_valores not in ("A", "B"):
-                raise ValueError(
-                    "clave_repr_valores debe ser 'A' o 'B' para clave_tipo_bien 'V' o 'I'"
-                )
+        if d.clave_repr_valores not in _VALID_CLAVE_REPR_VALORES:
+            return "clave_repr_valores_VI"
+    else:
+        if d.clave_identificacion != 0:
+            return "clave_identificacion_otros"
+        if d.identificacion_valores and d.identificacion_valores.strip():
+            return "identificacion_valores_otros"
+
+    # identificacion_entidad must be blank for B
+    if clave == _B:
+        if d.identificacion_entidad and d.identificacion_entidad.strip():
+            return "entidad_B"
+        if d.nif_entidad_pais_residencia and d.nif_entidad_pais_residencia.strip():
+            return "nif_entidad_B"
+
+    return None
+
+
+def _validar_declaracion(
+    header: Header720, detalles: Iterable[Detalle720], reglas_registros: bool = False
+) -> None:
+    """Check the record count and valoración sums of a declaration.
+
+    ``detalles`` is consumed in a single pass, so it may be any iterable.
+    With ``reglas_registros``, the header rules and the business rules of each
+    detail record are also checked during that pass.
+
+    Raises:
+        ValueError: Listing every problem found.
+    """
+    problems = []
+    detail_problems = []
+    h = header
+
+    if reglas_registros:
+        try:
+            h.validate_header_rules()
+        except ValueError as e:
+            problems.append(str(e))
+
+    # Validate valoración sums, accumulating both in a single pass
+    count = 0
+    sum1 = Decimal("0")
+    sum2 = Decimal("0")
+    for count, d in enumerate(detalles, start=1):
+        sum1 += d.valoracion_1.importe
+        sum2 += d.valoracion_2.importe
+        if reglas_registros:
+            regla = _regla_detalle_incumplida(d)
+            if regla is not None:
+                detail_problems.append((count, regla))
+
+    # Validate record count
+    if h.numero_total_registros != count:
+        problems.append(
+            f"Número total de registros {h.numero_total_registros} "
+            f"no concuerda con el número de detalles {count}"
+        )
+    problems.extend(f"Detalle {i}: {_RULE_MSG[regla]}" for i, regla in detail_problems)
 
-        # identificacion_entidad must be blank for B
-        if self.clave_tipo_bien == ClaveBien.B:
-            if self.identificacion_entidad and self.identificacion_entidad.strip():
-                raise ValueError(
-                    "identificacion_entidad debe estar en blanco para clave_tipo_bien 'B'"
-                )
-            if (
-                self.nif_entidad_pais_residencia
-                and self.nif_entidad_pais_residencia.strip()
-            ):
-                raise ValueError(
-                    "nif_entidad_pais_residencia debe estar en blanco para clave_tipo_bien 'B'"
-                )
+    if sum1 != h.suma_valoracion_1.importe:
+        problems.append(
+            f"SUMA VALORACIÓN 1 no concuerda: encabezado {h.suma_valoracion_1.importe} "
+            f"no concuerda con suma {sum1}"
+        )
 
-        return self
+    if sum2 != h.suma_valoracion_2.importe:
+        problems.append(
+            f"SUMA VALORACIÓN 2 no concuerda: encabezado {h.suma_valoracion_2.importe} "
+            f"no concuerda con suma {sum2}"
+        )
+
+    if problems:
+        raise ValueError("; ".join(problems))
 
 
 class Declaration(BaseModel):
@@ -448,40 +547,49 @@ class Declaration(BaseModel):
     header: Header720
     detalles: List[Detalle720] = Field(default_factory=list)
 
-    model_config = {"arbitrary_types_allowed": True}
-
     def print_detalle(self, detalle: Detalle720, idx: int):
         """Print a single detail record."""
 
-        print(
+        buf = io.StringIO()
+        self._write_detalle(buf.write, detalle, idx)
+        sys.stdout.write(buf.getvalue())
+
+    def _write_detalle(self, w, detalle: Detalle720, idx: int):
+        """Write the lines describing a detail record through ``w``."""
+
+        w(
             f"[{idx}] Bien {detalle.clave_tipo_bien.value} | "
-            f"País {detalle.codigo_pais} | Valor: {detalle.valoracion_1.importe}€"
-        )
-        print(
-            f"  Declarado: {detalle.nif_declarado} - {detalle.nombre_razon_declarado}"
+            f"País {detalle.codigo_pais} | Valor: {detalle.valoracion_1.importe}€\n"
         )
+        w(f"  Declarado: {detalle.nif_declarado} - {detalle.nombre_razon_declarado}\n")
         if detalle.fecha_incorporacion:
-            print(f"  Fecha incorporación: {detalle.fecha_incorporacion}")
+            w(f"  Fecha incorporación: {detalle.fecha_incorporacion}\n")
         if detalle.fecha_extincion:
-            print(f"  Fecha extinción: {detalle.fecha_extincion}")
-        print(
+            w(f"  Fecha extinción: {detalle.fecha_extincion}\n")
+        w(
             f"  Porcentaje: {detalle.porcentaje_participacion_entera}."
-            f"{detalle.porcentaje_participacion_decimal:02d}%"
+            f"{detalle.porcentaje_participacion_decimal:02d}%\n"
         )
 
     def print_declaration(self):
-        """Print the entire declaration, including header and details."""
+        """Print the entire declaration, including header and details.
 
-        print(f"Modelo {self.header.modelo} - Ejercicio {self.header.ejercicio}")
-        print(f"Declarante: {self.header.nif_declarante} - {self.header.nombre_razon}")
-        print(f"Número identificativo: {self.header.numero_identificativo}")
-        print(f"Registros declarados: {self.header.numero_total_registros}")
-        print(
+        The output is built in memory and written to stdout in one call.
+        """
+
+        buf = io.StringIO()
+        w = buf.write
+        w(f"Modelo {self.header.modelo} - Ejercicio {self.header.ejercicio}\n")
+        w(f"Declarante: {self.header.nif_declarante} - {self.header.nombre_razon}\n")
+        w(f"Número identificativo: {self.header.numero_identificativo}\n")
+        w(f"Registros declarados: {self.header.numero_total_registros}\n")
+        w(
             f"Suma valoración 1: {self.header.suma_valoracion_1.importe} "
-            f"| Suma valoración 2: {self.header.suma_valoracion_2.importe}"
+            f"| Suma valoración 2: {self.header.suma_valoracion_2.importe}\n"
         )
         for i, d in enumerate(self.detalles, start=1):
-            self.print_detalle(d, i)
+            self._write_detalle(w, d, i)
+        sys.stdout.write(buf.getvalue())
 
     @model_validator(mode="after")
     def validate_business_rules(self):
@@ -495,48 +603,94 @@ class Declaration(BaseModel):
         Note: Input validation (field types, required fields, etc.) is handled
         automatically by Pydantic validators on individual fields.
         """
-        problems = []
-        h = self.header
-
-        # Validate record count
-        if h.numero_total_registros != len(self.detalles):
-            problems.append(
-                f"Número total de registros {h.numero_total_registros} "
-                f"no concuerda con el número de detalles {len(self.detalles)}"
-            )
+        _validar_declaracion(self.header, self.detalles)
+        return self
 
-        # Validate valoración sums
-        sum1 = sum((d.valoracion_1.importe for d in self.detalles), Decimal("0"))
-        if (sum1 - h.suma_valoracion_1.importe).copy_abs() > Decimal("0.00"):
-            problems.append(
-                f"SUMA VALORACIÓN 1 no concuerda: encabezado {h.suma_valoracion_1.importe} "
-                f"no concuerda con suma {sum1}"
-            )
+    def validate(self, deep: bool = False) -> None:
+        """Legacy validate method for backward compatibility.
 
-        sum2 = sum((d.valoracion_2.importe for d in self.detalles), Decimal("0"))
-        if (sum2 - h.suma_valoracion_2.importe).copy_abs() > Decimal("0.00"):
-            problems.append(
-                f"SUMA VALORACIÓN 2 no concuerda: encabezado {h.suma_valoracion_2.importe} "
-                f"no concuerda con suma {sum2}"
-            )
+        Re-checks the header rules, the business rules of every detail record
+        and the declaration totals in a single pass, so that changes made to
+        the records after construction are taken into account. Field-level
+        constraints (types, lengths, NIF format) are only enforced when the
+        models are built, unless ``deep`` is set.
 
-        if problems:
-            raise ValueError("; ".join(problems))
+        Args:
+            deep: Rebuild the whole declaration through Pydantic validation,
+                also re-checking every field. Much slower on large declarations.
 
-        return self
+        Raises:
+            DeclarationValidationError: If any validation rule fails.
+        """
+        if deep:
+            try:
+                type(self).model_validate(self.model_dump())
+            except ValueError as e:
+                raise DeclarationValidationError(str(e)) from e
+            return
+        self.validate_stream(self.header, self.detalles)
 
-    def validate(self) -> None:
-        """Legacy validate method for backward compatibility.
+    @classmethod
+    def from_raw(cls, header_data, detalle_list: Iterable) -> "Declaration":
+        """Build a declaration from raw header and detail data (e.g. dicts).
+
+        The header and the whole detail list are validated in bulk through
+        module-level TypeAdapters, and the declaration is then assembled
+        without re-validating its already-checked parts.
+
+        Raises:
+            ValueError: If any field or business rule is invalid.
+        """
+        header = HEADER_ADAPTER.validate_python(header_data)
+        detalles = DETALLE_LIST_ADAPTER.validate_python(detalle_list)
+        return cls.construct_validated(header, detalles)
+
+    @classmethod
+    def from_json(cls, raw: Union[bytes, str]) -> "Declaration":
+        """Build a declaration from a JSON document.
+
+        The JSON is parsed and validated directly by Pydantic, without
+        building an intermediate dict.
+
+        Raises:
+            ValueError: If the document or any business rule is invalid.
+        """
+        return cls.model_validate_json(raw)
+
+    @classmethod
+    def construct_validated(
+        cls, header: Header720, detalles: List[Detalle720]
+    ) -> "Declaration":
+        """Assemble a declaration from already validated records.
 
-        Note: Most validation is now handled automatically by Pydantic.
-        This method is kept for explicit validation calls and will raise
-        DeclarationValidationError to maintain API compatibility.
+        Only the declaration-level business rules are checked; the fields of
+        ``header`` and ``detalles`` are not re-validated, so the caller must
+        pass Header720 and Detalle720 instances, not dicts.
+
+        Raises:
+            ValueError: If the record count or the sums do not match.
+        """
+        obj = cls.model_construct(header=header, detalles=detalles)
+        obj.validate_business_rules()
+        return obj
+
+    @staticmethod
+    def validate_stream(header: Header720, detalles: Iterable[Detalle720]) -> None:
+        """Validate a declaration given as a header and an iterable of details.
+
+        Runs the same checks as validate() while consuming ``detalles`` only
+        once, so details can be produced lazily (e.g. from a generator) and
+        never held in memory all at once.
 
         Raises:
             DeclarationValidationError: If any validation rule fails.
         """
         try:
-            # Trigger Pydantic validation by accessing model_validate
-            self.model_validate(self.model_dump())
+            _validar_declaracion(header, detalles, reglas_registros=True)
         except ValueError as e:
             raise DeclarationValidationError(str(e)) from e
+
+
+# Validadores reutilizables para la carga masiva de registros
+HEADER_ADAPTER = TypeAdapter(Header720)
+DETALLE_LIST_ADAPTER = TypeAdapter(List[Detalle720])
@@ -14,10 +14,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal, ROUND_DOWN
-from enum import Enum
-from typing import List, Optional, Union
+from functools import lru_cache
+from itertools import chain, repeat
+from typing import List, Optional, Tuple, Union
 import csv
-import re
 
 from .declaracion import (
     Declaration,
@@ -29,6 +29,12 @@ from .declaracion import (
     DeclarationValidationError,
 )
 
+# Constante decimal reutilizada al leer importes
+_CENT = Decimal("0.01")
+
+# Valores de texto que se leen como verdadero en los campos booleanos del CSV
+_CSV_TRUE = frozenset({"1", "true", "t", "yes", "y", "si", "sí"})
+
 
 @dataclass
 class FieldSpec:
@@ -100,6 +106,36 @@ DETALLE_FIELDS = [
     FieldSpec("porcentaje_participacion_decimal", 479, 480, "int"),
 ]
 
+# Column names of the detail section in the CSV format
+DETALLE_COLUMNS = [fs.name for fs in DETALLE_FIELDS]
+
+
+@lru_cache(maxsize=None)
+def _enum_members(enum_class: type) -> dict:
+    """Map each value of ``enum_class`` to its member."""
+    return {m.value: m for m in enum_class}
+
+
+@lru_cache(maxsize=4096)
+def _signo_e_importe(importe: str) -> Tuple[str, Decimal]:
+    """Split a euro amount string into its sign and absolute value.
+
+    The same amounts repeat across many records, so results are memoized.
+    """
+    d = Decimal(importe)
+    signo = "N" if d < 0 else " "
+    return signo, abs(d).quantize(_CENT, rounding=ROUND_DOWN)
+
+
+@lru_cache(maxsize=4096)
+def _fecha_aaaammdd(s: str) -> date:
+    """Build the date for 8 ASCII digits in AAAAMMDD order.
+
+    The same dates tend to repeat across records, so results are memoized.
+    """
+    n = int(s)
+    return date(n // 10000, n // 100 % 100, n % 100)
+
 
 class CSV720Error(Exception):
     """Exception raised for errors in the CSV 720 format."""
@@ -108,35 +144,55 @@ class CSV720Error(Exception):
 class Parser:
     """Parser and validator for Agencia Tributaria Modelo 720 fixed-width and CSV files."""
 
+    def __init__(self):
+        # Field dispatch is resolved once, not for every line read
+        self._header_specs = self._compile_specs(HEADER_FIELDS)
+        self._detalle_specs = self._compile_specs(DETALLE_FIELDS)
+        self._header_format = tuple(
+            (fs.name, self._value_formatter(fs)) for fs in HEADER_FIELDS
+        )
+        self._detalle_format = tuple(
+            (fs.name, self._value_formatter(fs)) for fs in DETALLE_FIELDS
+        )
+        self._header_csv_specs = self._compile_csv_specs(HEADER_FIELDS)
+        self._detalle_csv_specs = self._compile_csv_specs(DETALLE_FIELDS)
+        self._header_csv = tuple(
+            (fs.name, self._csv_formatter(fs)) for fs in HEADER_FIELDS
+        )
+        self._detalle_csv = tuple(
+            (fs.name, self._csv_formatter(fs)) for fs in DETALLE_FIELDS
+        )
+
     def _to_int(self, s: str) -> int:
         """Convert string to integer, treating empty as 0."""
         s = s.strip()
         if not s:
             return 0
-        if not re.fullmatch(r"[0-9]+", s):
+        if not (s.isascii() and s.isdigit()):
             raise ValueError(f"Expected numeric, got {s!r}")
         return int(s)
 
-    def _to_decimal_from_cents(self, sign_char: str, cents_str: str) -> Decimal:
-        """Convert sign character and cents string to Decimal."""
+    def _to_cents(self, sign_char: str, cents_str: str) -> int:
+        """Convert sign character and cents string to signed integer cents."""
         if not cents_str.strip():
-            return Decimal("0.00")
-        if not re.fullmatch(r"[0-9]+", cents_str):
+            return 0
+        if not (cents_str.isascii() and cents_str.isdigit()):
             raise ValueError(f"Expected numeric cents, got {cents_str!r}")
-        val = Decimal(int(cents_str)).scaleb(-2)
-        if sign_char == "N":
-            val = -val
-        return val.quantize(Decimal("0.01"), rounding=ROUND_DOWN)
+        cents = int(cents_str)
+        return -cents if sign_char == "N" else cents
+
+    def _to_decimal_from_cents(self, sign_char: str, cents_str: str) -> Decimal:
+        """Convert sign character and cents string to Decimal."""
+        return Decimal(self._to_cents(sign_char, cents_str)).scaleb(-2)
 
     def _to_date8(self, s: str) -> Optional[date]:
         """Convert 8-digit string to date, handling empty/zero cases."""
         s = s.strip()
         if not s or s == "00000000":
             return None
-        if not re.fullmatch(r"[0-9]{8}", s):
+        if len(s) != 8 or not (s.isascii() and s.isdigit()):
             raise ValueError(f"Expected AAAAMMDD, got {s!r}")
-        y, m, d = int(s[:4]), int(s[4:6]), int(s[6:8])
-        return date(y, m, d)
+        return _fecha_aaaammdd(s)
 
     def _parse_field(self, line: str, field_spec: FieldSpec) -> any:
         """Parse a single field from a line based on field specification."""
@@ -144,86 +200,130 @@ class Parser:
         return self._parse_raw_value(raw_value, field_spec)
 
     def _parse_raw_value(self, raw_value: str, field_spec: FieldSpec) -> any:
-        if field_spec.transform == "str":
-            return raw_value.rstrip() if raw_value else ""
-
-        elif field_spec.transform == "int":
-            return self._to_int(raw_value)
-
-        elif field_spec.transform == "date8":
-            return self._to_date8(raw_value)
-
-        elif field_spec.transform == "bool_c":
-            return raw_value.strip() == "C"
-
-        elif field_spec.transform == "bool_s":
-            return raw_value.strip() == "S"
-
-        elif field_spec.transform == "enum":
-            stripped = raw_value.strip()
-            return field_spec.enum_class(stripped) if stripped else None
-
-        elif field_spec.transform == "valoracion":
-            # Handle valoracion fields (sign + amount)
-            # For fixed-width, this represents sign + 17 digits
-            # (valoracion uses positions like 145-162)
-            sign_char = raw_value[0] if raw_value else " "
-            amount_str = raw_value[1:] if len(raw_value) > 1 else ""
-            return Valoracion(
-                signo=sign_char,
-                importe=self._to_decimal_from_cents(sign_char, amount_str),
-            )
+        return self._value_parser(field_spec)(raw_value)
+
+    def _to_valoracion(self, raw_value: str) -> Valoracion:
+        """Convert sign character plus amount in cents to Valoracion."""
+        # For fixed-width, this represents sign + 17 digits
+        # (valoracion uses positions like 145-162)
+        sign_char = raw_value[0] if raw_value else " "
+        amount_str = raw_value[1:] if len(raw_value) > 1 else ""
+        return Valoracion(
+            signo=sign_char,
+            importe=self._to_decimal_from_cents(sign_char, amount_str),
+        )
+
+    def _value_parser(self, field_spec: FieldSpec):
+        """Return the function converting a raw field value of ``field_spec``."""
+        transform = field_spec.transform
+        if transform == "str":
+            return str.rstrip
+
+        elif transform == "int":
+            return self._to_int
+
+        elif transform == "date8":
+            return self._to_date8
+
+        elif transform == "bool_c":
+            return lambda raw: raw.strip() == "C"
+
+        elif transform == "bool_s":
+            return lambda raw: raw.strip() == "S"
+
+        elif transform == "enum":
+            enum_class = field_spec.enum_class
+            members = _enum_members(enum_class)
+
+            def parse_enum(raw):
+                stripped = raw.strip()
+                if not stripped:
+                    return None
+                try:
+                    return members[stripped]
+                except KeyError:
+                    raise ValueError(
+                        f"{stripped!r} is not a valid {enum_class.__name__}"
+                    ) from None
+
+            return parse_enum
+
+        elif transform == "valoracion":
+            return self._to_valoracion
 
         else:
-            raise ValueError(f"Unknown transform type: {field_spec.transform}")
+            raise ValueError(f"Unknown transform type: {transform}")
+
+    def _compile_specs(self, field_specs: List[FieldSpec]) -> tuple:
+        """Resolve each field spec once into a (name, slice, parser) triple."""
+        return tuple(
+            (fs.name, slice(fs.start - 1, fs.end), self._value_parser(fs))
+            for fs in field_specs
+        )
 
     def _parse_line(self, line: str, field_specs: List[FieldSpec]) -> dict:
         """Parse a line using field specifications."""
+        return self._parse_compiled_line(line, self._compile_specs(field_specs))
+
+    def _parse_compiled_line(self, line: str, compiled_specs: tuple) -> dict:
+        """Parse a line using field specifications compiled by _compile_specs."""
         result = {}
-        for field_spec in field_specs:
-            try:
-                result[field_spec.name] = self._parse_field(line, field_spec)
-            except Exception as e:
-                msg = f"Error parsing field '{field_spec.name}': {e}"
-                raise ValueError(msg) from e
+        name = None
+        try:
+            for name, sl, parse in compiled_specs:
+                result[name] = parse(line[sl])
+        except Exception as e:
+            msg = f"Error parsing field '{name}': {e}"
+            raise ValueError(msg) from e
         return result
 
     def _parse_header(self, line: str) -> Header720:
         """Parse header line using field specifications."""
-        fields = self._parse_line(line, HEADER_FIELDS)
-        return Header720(**fields)
+        fields = self._parse_compiled_line(line, self._header_specs)
+        return Header720.model_validate(fields)
 
     def _parse_detalle(self, line: str) -> Detalle720:
         """Parse detail line using field specifications."""
-        fields = self._parse_line(line, DETALLE_FIELDS)
-        return Detalle720(**fields)
+        fields = self._parse_compiled_line(line, self._detalle_specs)
+        return Detalle720.model_validate(fields)
 
     def read_fixed_width(self, file_path: str) -> Declaration:
         """Read Modelo 720 from fixed-width format."""
         with open(file_path, "r", encoding="ISO-8859-1") as f:
-            lines = [ln.rstrip("\n\r") for ln in f if ln.strip()]
-        header = self._parse_header(lines[0])
-        detalles = [self._parse_detalle(ln) for ln in lines[1:]]
+            # Universal newlines already turn \r\n into \n; splitlines() is
+            # avoided because it also breaks on \x85 and other Latin-1 controls
+            lines = (ln for ln in f.read().split("\n") if ln.strip())
+        header_line = next(lines, None)
+        if header_line is None:
+            raise ValueError(f"No records found in {file_path}")
+        header = self._parse_header(header_line)
+        detalles = [self._parse_detalle(ln) for ln in lines]
         return Declaration(header=header, detalles=detalles)
 
     def write_fixed_width(self, declaration: Declaration, file_path: str):
         """Write declaration to fixed-width Modelo 720 format."""
+        lines = [self._format_compiled_line(declaration.header, self._header_format)]
+        lines.extend(
+            self._format_compiled_line(detalle, self._detalle_format)
+            for detalle in declaration.detalles
+        )
+        # Lines are formatted before the file is opened, then written at once
         with open(file_path, "w", encoding="ISO-8859-1") as f:
-            header_line = self._format_record_line(declaration.header, HEADER_FIELDS)
-            f.write(header_line + "\n")
-
-            for detalle in declaration.detalles:
-                detail_line = self._format_record_line(detalle, DETALLE_FIELDS)
-                f.write(detail_line + "\n")
+            f.write("\n".join(lines) + "\n")
 
     def _format_record_line(
         self, record: Union[Header720, Detalle720], field_specs: List[FieldSpec]
     ) -> str:
         """Format a record to fixed-width string using the provided field specifications."""
-        line = ""
-        for field_spec in field_specs:
-            value = self._format_field_value(record, field_spec)
-            line += value
+        return self._format_compiled_line(
+            record, tuple((fs.name, self._value_formatter(fs)) for fs in field_specs)
+        )
+
+    def _format_compiled_line(
+        self, record: Union[Header720, Detalle720], compiled_formatters: tuple
+    ) -> str:
+        """Format a record to fixed-width string using the provided field formatters."""
+        line = "".join(fmt(getattr(record, name)) for name, fmt in compiled_formatters)
         # Pad to exactly 500 characters
         return line.ljust(500)
 
@@ -231,51 +331,55 @@ class Parser:
         self, record: Union[Header720, Detalle720], field_spec: FieldSpec
     ) -> str:
         """Format a single field value according to its field specification."""
-        raw_value = getattr(record, field_spec.name)
+        return self._value_formatter(field_spec)(getattr(record, field_spec.name))
+
+    def _value_formatter(self, field_spec: FieldSpec):
+        """Return the function rendering a value of ``field_spec`` in fixed width."""
+        transform = field_spec.transform
         field_width = field_spec.end - field_spec.start + 1
 
-        if field_spec.transform == "str":
+        if transform == "str":
             # String fields: left-aligned, padded with spaces
-            value = str(raw_value) if raw_value is not None else ""
-            return value.ljust(field_width)[:field_width]
+            def format_str(v):
+                value = str(v) if v is not None else ""
+                return value.ljust(field_width)[:field_width]
 
-        elif field_spec.transform == "int":
+            return format_str
+
+        elif transform == "int":
             # Integer fields: right-aligned, zero-padded
-            value = str(raw_value) if raw_value is not None else "0"
-            return value.zfill(field_width)
+            return lambda v: (str(v) if v is not None else "0").zfill(field_width)
 
-        elif field_spec.transform == "date8":
+        elif transform == "date8":
             # Date fields: AAAAMMDD format or 00000000 for None
-            if raw_value is None:
-                return "00000000"
-            else:
-                return raw_value.strftime("%Y%m%d")
+            return lambda v: "00000000" if v is None else v.strftime("%Y%m%d")
 
-        elif field_spec.transform == "bool_c":
+        elif transform == "bool_c":
             # Boolean fields (C for True, space for False)
-            return "C" if raw_value else " "
+            return lambda v: "C" if v else " "
 
-        elif field_spec.transform == "bool_s":
+        elif transform == "bool_s":
             # Boolean fields (S for True, space for False)
-            return "S" if raw_value else " "
+            return lambda v: "S" if v else " "
 
-        elif field_spec.transform == "enum":
+        elif transform == "enum":
             # Enum fields: use the enum value
-            return raw_value.value if raw_value is not None else " "
+            return lambda v: v.value if v is not None else " "
 
-        elif field_spec.transform == "valoracion":
+        elif transform == "valoracion":
             # Valoracion fields: sign + amount in cents (17 digits total)
-            if raw_value is None:
-                return " " + "0".zfill(field_width - 1)
+            amount_width = field_width - 1
+            empty = " " + "0" * amount_width
 
-            sign = raw_value.signo
-            # Convert to cents (multiply by 100) and format as integer
-            cents = int(raw_value.importe * 100)
-            amount_str = str(cents).zfill(field_width - 1)
-            return sign + amount_str
+            def format_valoracion(v):
+                if v is None:
+                    return empty
+                return v.signo + str(int(v.importe * 100)).zfill(amount_width)
+
+            return format_valoracion
 
         else:
-            raise ValueError(f"Unknown field transform: {field_spec.transform}")
+            raise ValueError(f"Unknown field transform: {transform}")
 
     def write_csv(self, declaration: Declaration, file_path: str):
         """Write declaration to CSV format."""
@@ -286,99 +390,94 @@ class Parser:
             w.writerow(["__SECTION__", "HEADER"])
             w.writerow(["field", "value"])
             h = declaration.header
-            for field_spec in HEADER_FIELDS:
-                value = self._get_field_value_for_csv(h, field_spec)
-                w.writerow([field_spec.name, value])
+            w.writerows([name, fmt(getattr(h, name))] for name, fmt in self._header_csv)
 
             # Details section
             w.writerow(["__SECTION__", "DETALLES"])
-            w.writerow([f.name for f in DETALLE_FIELDS])
-            for d in declaration.detalles:
-                row = []
-                for field_spec in DETALLE_FIELDS:
-                    value = self._get_field_value_for_csv(d, field_spec)
-                    row.append(value)
-                w.writerow(row)
+            w.writerow(DETALLE_COLUMNS)
+            formatters = self._detalle_csv
+            w.writerows(
+                [fmt(getattr(d, name)) for name, fmt in formatters]
+                for d in declaration.detalles
+            )
 
     def _get_field_value_for_csv(
         self, record: Union[Header720, Detalle720], field_spec: FieldSpec
     ) -> str:
         """Get string representation of field for CSV."""
-        v = getattr(record, field_spec.name)
-        if isinstance(v, bool):
-            return "1" if v else "0"
-        elif isinstance(v, Enum):
-            return v.value
-        elif isinstance(v, date):
-            return v.isoformat()
-        elif isinstance(v, Valoracion):
-            return str(v.importe)
+        return self._csv_formatter(field_spec)(getattr(record, field_spec.name))
+
+    def _csv_formatter(self, field_spec: FieldSpec):
+        """Return the function rendering a value of ``field_spec`` for CSV."""
+        transform = field_spec.transform
+        if transform in ("bool_c", "bool_s"):
+            return lambda v: "1" if v else "0"
+
+        elif transform == "enum":
+            return lambda v: "" if v is None else v.value
+
+        elif transform == "date8":
+            return lambda v: "" if v is None else v.isoformat()
+
+        elif transform == "valoracion":
+            return lambda v: "" if v is None else str(v.importe)
+
         else:
-            return "" if v is None else str(v)
+            return lambda v: "" if v is None else str(v)
 
     def read_csv(self, file_path: str) -> Declaration:
         """Read declaration from CSV format."""
 
         with open(file_path, "r", newline="", encoding="utf-8") as f:
-            r = csv.reader(f)
-            rows = list(r)
+            # Rows are consumed as they are read, section by section
+            rows = csv.reader(f)
+            missing_markers = "Missing __SECTION__ markers for HEADER/DETALLES"
 
-        try:
-            header_start = (
-                next(
-                    i
-                    for i, row in enumerate(rows)
-                    if row[:2] == ["__SECTION__", "HEADER"]
-                )
-                + 1
-            )
-            detalles_start = (
-                next(
-                    i
-                    for i, row in enumerate(rows)
-                    if row[:2] == ["__SECTION__", "DETALLES"]
-                )
-                + 1
-            )
-        except StopIteration as exc:
-            raise CSV720Error(
-                "Missing __SECTION__ markers for HEADER/DETALLES"
-            ) from exc
-
-        # Parse header section
-        header_table = rows[header_start : detalles_start - 1]
-        if not header_table:
-            raise CSV720Error("Empty header section")
-        if header_table and header_table[0][:2] == ["field", "value"]:
-            header_table = header_table[1:]
-
-        hvals = {k: v for k, v, *_ in header_table}
-
-        # Parse header using field specifications
-        header_fields = self._parse_csv_line(hvals, HEADER_FIELDS)
-        header = Header720(**header_fields)
-
-        # Parse details section
-        det_header = rows[detalles_start]
-        expected_columns = [f.name for f in DETALLE_FIELDS]
-        if det_header != expected_columns:
-            raise CSV720Error("Detalles header row does not match expected columns")
-
-        det_rows = rows[detalles_start + 1 :]
-        detalles = []
-        for ridx, row in enumerate(det_rows, start=1):
-            if not any((c or "").strip() for c in row):
-                continue
-            vals = dict(zip(expected_columns, row))
-            try:
-                # Parse detail using field specifications
-                detalle_fields = self._parse_csv_line(vals, DETALLE_FIELDS)
-                detalle = Detalle720(**detalle_fields)
-                detalles.append(detalle)
-            except CSV720Error:
-                raise
-            except Exception as e:
-                raise CSV720Error(f"Error parsing detail row {ridx}: {e}") from e
+            for row in rows:
+                if row[:2] == ["__SECTION__", "HEADER"]:
+                    break
+            else:
+                raise CSV720Error(missing_markers)
+
+            header_table = []
+            for row in rows:
+                if row[:2] == ["__SECTION__", "DETALLES"]:
+                    break
+                header_table.append(row)
+            else:
+                raise CSV720Error(missing_markers)
+
+            # Parse header section
+            if not header_table:
+                raise CSV720Error("Empty header section")
+            if header_table[0][:2] == ["field", "value"]:
+                header_table = header_table[1:]
+
+            hvals = {k: v for k, v, *_ in header_table}
+
+            # Parse header using field specifications
+            header_fields = self._parse_csv_line(hvals, HEADER_FIELDS)
+            header = Header720.model_validate(header_fields)
+
+            # Parse details section
+            expected_columns = DETALLE_COLUMNS
+            if next(rows, None) != expected_columns:
+                raise CSV720Error("Detalles header row does not match expected columns")
+
+            detalles = []
+            for ridx, row in enumerate(rows, start=1):
+                # Skip rows whose cells are all blank
+                if not "".join(row).strip():
+                    continue
+                try:
+                    # Parse detail using field specifications
+                    detalle_fields = self._parse_csv_row(row, DETALLE_FIELDS)
+                    detalle = Detalle720.model_validate(detalle_fields)
+                    detalles.append(detalle)
+                except CSV720Error:
+                    raise
+                except Exception as e:
+                    raise CSV720Error(f"Error parsing detail row {ridx}: {e}") from e
 
         dec = Declaration(header=header, detalles=detalles)
         try:
@@ -392,47 +491,72 @@ class Parser:
         s = (s or "").strip()
         if not s:
             return Valoracion(signo=" ", importe=Decimal("0.00"))
-        d = Decimal(s)
-        signo = "N" if d < 0 else " "
-        return Valoracion(
-            signo=signo, importe=abs(d).quantize(Decimal("0.01"), rounding=ROUND_DOWN)
-        )
+        signo, importe = _signo_e_importe(s)
+        return Valoracion(signo=signo, importe=importe)
 
     def _parse_csv_field(self, csv_value: str, field_spec: FieldSpec) -> any:
         """Parse a CSV field value based on field specification."""
-        csv_value = (csv_value or "").strip()
+        return self._csv_value_parser(field_spec)((csv_value or "").strip())
 
-        if field_spec.transform == "date8":
-            if not csv_value:
-                return None
-            try:
-                return date.fromisoformat(csv_value)
-            except ValueError as e:
-                raise ValueError(
-                    f"Expected YYYY-MM-DD date for field '{field_spec.name}', got {csv_value!r}"
-                ) from e
+    def _csv_value_parser(self, field_spec: FieldSpec):
+        """Return the function converting a stripped CSV value of ``field_spec``."""
+        transform = field_spec.transform
+        if transform == "date8":
+            name = field_spec.name
 
-        elif field_spec.transform == "bool_c":
-            return csv_value.lower() in {"1", "true", "t", "yes", "y", "si", "sí"}
+            def parse_date(csv_value):
+                if not csv_value:
+                    return None
+                try:
+                    return date.fromisoformat(csv_value)
+                except ValueError as e:
+                    raise ValueError(
+                        f"Expected YYYY-MM-DD date for field '{name}', got {csv_value!r}"
+                    ) from e
 
-        elif field_spec.transform == "bool_s":
-            return csv_value.lower() in {"1", "true", "t", "yes", "y", "si", "sí"}
+            return parse_date
 
-        elif field_spec.transform == "valoracion":
-            return self._parse_valoracion_from_string(csv_value)
+        elif transform in ("bool_c", "bool_s"):
+            return lambda csv_value: csv_value.lower() in _CSV_TRUE
+
+        elif transform == "valoracion":
+            return self._parse_valoracion_from_string
 
         else:
             # all other types
-            return self._parse_raw_value(csv_value, field_spec)
+            return self._value_parser(field_spec)
+
+    def _compile_csv_specs(self, field_specs: List[FieldSpec]) -> tuple:
+        """Resolve each field spec once into a (name, CSV parser) pair."""
+        return tuple((fs.name, self._csv_value_parser(fs)) for fs in field_specs)
 
     def _parse_csv_line(self, csv_values: dict, field_specs: List[FieldSpec]) -> dict:
         """Parse CSV values using field specifications."""
+        if field_specs is HEADER_FIELDS:
+            compiled_specs = self._header_csv_specs
+        else:
+            compiled_specs = self._compile_csv_specs(field_specs)
+        return self._parse_csv_values(
+            (spec, csv_values.get(spec[0], "")) for spec in compiled_specs
+        )
+
+    def _parse_csv_row(self, row: List[str], field_specs: List[FieldSpec]) -> dict:
+        """Parse a CSV row whose cells follow the order of ``field_specs``."""
+        if field_specs is DETALLE_FIELDS:
+            compiled_specs = self._detalle_csv_specs
+        else:
+            compiled_specs = self._compile_csv_specs(field_specs)
+        # Missing trailing cells are read as empty values
+        return self._parse_csv_values(zip(compiled_specs, chain(row, repeat(""))))
+
+    def _parse_csv_values(self, spec_values) -> dict:
+        """Parse (compiled CSV field specification, CSV value) pairs into a field dict."""
         result = {}
-        for field_spec in field_specs:
-            try:
-                csv_value = csv_values.get(field_spec.name, "")
-                result[field_spec.name] = self._parse_csv_field(csv_value, field_spec)
-            except Exception as e:
-                msg = f"Error parsing CSV field '{field_spec.name}': {e}"
-                raise CSV720Error(msg) from e
+        name = None
+        try:
+            for (name, parse), csv_value in spec_values:
+                result[name] = parse((csv_value or "").strip())
+        except Exception as e:
+            msg = f"Error parsing CSV field '{name}': {e}"
+            raise CSV720Error(msg) from e
         return result
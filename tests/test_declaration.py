@@ -113,6 +113,58 @@ class TestDeclarationValidation(unittest.TestCase):
             self.declaration.validate()
         self.assertIn("subclave must be 0", str(cm.exception))
 
+    def test_validate_header_rules(self):
+        """Test header rules are re-checked after modification."""
+        self.header.declaracion_complementaria = True
+        with self.assertRaises(DeclarationValidationError) as cm:
+            self.declaration.validate()
+        self.assertIn("numero_identificativo_anterior", str(cm.exception))
+
+    def test_validate_deep(self):
+        """Test deep validation re-checks field constraints."""
+        self.declaration.validate(deep=True)
+
+        self.detalle.nif_declarado = "12345678A"
+        self.declaration.validate()
+        with self.assertRaises(DeclarationValidationError) as cm:
+            self.declaration.validate(deep=True)
+        self.assertIn("nif_declarado", str(cm.exception))
+
+    def test_validate_stream(self):
+        """Test validation of details supplied as a one-shot iterator."""
+        Declaration.validate_stream(self.header, iter([self.detalle]))
+
+        with self.assertRaises(DeclarationValidationError) as cm:
+            Declaration.validate_stream(self.header, iter([]))
+        self.assertIn("no concuerda con el número de detalles", str(cm.exception))
+
+    def test_from_raw(self):
+        """Test building a declaration from raw dicts."""
+        header_data = self.header.model_dump()
+        detalles_data = [self.detalle.model_dump()]
+        declaration = Declaration.from_raw(header_data, detalles_data)
+        self.assertEqual(declaration, self.declaration)
+
+        header_data["numero_total_registros"] = 2
+        with self.assertRaises(ValueError) as cm:
+            Declaration.from_raw(header_data, detalles_data)
+        self.assertIn("no concuerda con el número de detalles", str(cm.exception))
+
+    def test_from_json(self):
+        """Test building a declaration from JSON."""
+        raw = self.declaration.model_dump_json()
+        self.assertEqual(Declaration.from_json(raw), self.declaration)
+        self.assertEqual(Declaration.from_json(raw.encode()), self.declaration)
+
+    def test_construct_validated(self):
+        """Test assembling a declaration from validated records."""
+        declaration = Declaration.construct_validated(self.header, [self.detalle])
+        self.assertEqual(declaration, self.declaration)
+
+        with self.assertRaises(ValueError) as cm:
+            Declaration.construct_validated(self.header, [])
+        self.assertIn("no concuerda con el número de detalles", str(cm.exception))
+
     def test_validate_raises_exception(self):
         """Test validate raises exception on errors."""
         self.header.numero_total_registros = 10
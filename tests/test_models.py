@@ -25,6 +25,36 @@ class TestValoracionModel(unittest.TestCase):
         self.assertEqual(val.signo, "N")
         self.assertEqual(val.importe, Decimal("1234.56"))
 
+    def test_valoracion_importe_cents(self):
+        """Test importe_cents gives the amount in cents."""
+        val = Valoracion(signo=" ", importe=Decimal("1234.56"))
+        self.assertEqual(val.importe_cents, 123456)
+        self.assertIsInstance(val.importe_cents, int)
+
+        val = Valoracion(signo=" ", importe="1.999")
+        self.assertEqual(val.importe, Decimal("1.999"))
+        self.assertEqual(val.importe_cents, Decimal("199.9"))
+
+    def test_valoracion_serialization(self):
+        """Test valoracion serializes its amount as importe."""
+        val = Valoracion(signo=" ", importe=Decimal("580120.91"))
+        self.assertEqual(
+            val.model_dump(), {"signo": " ", "importe": Decimal("580120.91")}
+        )
+        self.assertEqual(val.model_dump_json(), '{"signo":" ","importe":"580120.91"}')
+        self.assertEqual(Valoracion.model_validate_json(val.model_dump_json()), val)
+        self.assertEqual(val.model_dump(exclude={"signo"}), {"importe": val.importe})
+
+    def test_valoracion_copy_and_construct(self):
+        """Test model_copy and model_construct keep importe in sync."""
+        val = Valoracion(signo=" ", importe=Decimal("1.00"))
+        copia = val.model_copy(update={"importe": Decimal("2.50")})
+        self.assertEqual(copia.importe, Decimal("2.50"))
+        self.assertEqual(copia.importe_cents, 250)
+
+        val = Valoracion.model_construct(signo=" ", importe=Decimal("1.00"))
+        self.assertEqual(val.importe_cents, 100)
+
     def test_valoracion_invalid_signo(self):
         """Test invalid signo raises error."""
         with self.assertRaises(ValidationError):
@@ -337,6 +367,30 @@ class TestDetalle720Validation(unittest.TestCase):
         with self.assertRaises(ValidationError):
             Detalle720(**detalle_data)
 
+    def test_detalle_rule_precedence(self):
+        """Test the first broken rule is reported in the original check order."""
+        # tipo_derecho_real_inmueble is checked before the extinction date
+        detalle_data = self.create_valid_detalle().__dict__
+        detalle_data["clave_tipo_bien"] = ClaveBien.B
+        detalle_data["subclave"] = 5
+        detalle_data["clave_ident_cuenta"] = ""
+        detalle_data["clave_tipo_bien_inmueble"] = "U"
+        detalle_data["origen"] = Origen.C
+        detalle_data["fecha_extincion"] = None
+        with self.assertRaises(ValidationError) as cm:
+            Detalle720(**detalle_data)
+        self.assertIn("tipo_derecho_real_inmueble es obligatorio", str(cm.exception))
+
+        # clave_identificacion is checked before identificacion_entidad
+        detalle_data = self.create_valid_detalle().__dict__
+        detalle_data["clave_tipo_bien"] = ClaveBien.B
+        detalle_data["clave_ident_cuenta"] = ""
+        detalle_data["clave_tipo_bien_inmueble"] = "U"
+        detalle_data["clave_identificacion"] = 1
+        with self.assertRaises(ValidationError) as cm:
+            Detalle720(**detalle_data)
+        self.assertIn("clave_identificacion debe ser 0", str(cm.exception))
+
     def test_detalle_clave_identificacion_for_V(self):
         """Test clave_identificacion required for V."""
         # Create a fully valid V detalle
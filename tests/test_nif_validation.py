@@ -17,8 +17,8 @@ class TestNIFValidation(unittest.TestCase):
     def test_valid_nie(self):
         """Test valid NIE formats."""
         self.assertTrue(validar_nif("X1234567L"))
-        self.assertTrue(validar_nif("Y9876543F"))
-        self.assertTrue(validar_nif("Z0123456P"))
+        self.assertTrue(validar_nif("Y9876543N"))
+        self.assertTrue(validar_nif("Z0123456C"))
 
     def test_invalid_nif_wrong_letter(self):
         """Test invalid NIF with wrong control letter."""
@@ -32,6 +32,12 @@ class TestNIFValidation(unittest.TestCase):
         self.assertFalse(validar_nif("123456789"))
         self.assertFalse(validar_nif("ABCDEFGHI"))
 
+    def test_invalid_nie_letters_after_prefix(self):
+        """Test NIE letters are only accepted as the first character."""
+        self.assertFalse(validar_nif("XZZZZZZZP"))
+        self.assertFalse(validar_nif("X1Y34567T"))
+        self.assertFalse(validar_nif("1234567XL"))
+
     def test_nif_case_insensitive(self):
         """Test NIF validation is case-insensitive."""
         self.assertTrue(validar_nif("12345678z"))
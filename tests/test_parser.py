@@ -5,7 +5,7 @@ import unittest
 from datetime import date
 from decimal import Decimal
 
-from Modelo720 import Parser, Valoracion
+from Modelo720 import CSV720Error, Parser, Valoracion
 from Modelo720.parser import FieldSpec, HEADER_FIELDS, DETALLE_FIELDS
 from Modelo720.declaracion import ClaveBien, Origen
 
@@ -141,6 +141,14 @@ class TestParsingHelpers(unittest.TestCase):
         result = self.parser._to_decimal_from_cents(" ", "")
         self.assertEqual(result, Decimal("0.00"))
 
+    def test_to_cents(self):
+        """Test integer cents conversion."""
+        self.assertEqual(self.parser._to_cents(" ", "123456"), 123456)
+        self.assertEqual(self.parser._to_cents("N", "789000"), -789000)
+        self.assertEqual(self.parser._to_cents(" ", "   "), 0)
+        with self.assertRaises(ValueError):
+            self.parser._to_cents(" ", "12a4")
+
 
 class TestFieldParsing(unittest.TestCase):
     """Test field parsing using FieldSpec."""
@@ -173,6 +181,29 @@ class TestFieldParsing(unittest.TestCase):
         self.assertEqual(result.signo, " ")
         self.assertEqual(result.importe, Decimal("12345678.90"))
 
+    def test_parse_line_field_specs(self):
+        """Test line parsing with a list of field specifications."""
+        field_specs = [
+            FieldSpec("clave_bien", 1, 1, "enum", enum_class=ClaveBien),
+            FieldSpec("nombre", 2, 11, "str"),
+            FieldSpec("subclave", 12, 12, "int"),
+        ]
+        result = self.parser._parse_line("VACME      3", field_specs)
+        self.assertEqual(
+            result, {"clave_bien": ClaveBien.V, "nombre": "ACME", "subclave": 3}
+        )
+
+        with self.assertRaises(ValueError) as cm:
+            self.parser._parse_line("XACME      3", field_specs)
+        self.assertIn("Error parsing field 'clave_bien'", str(cm.exception))
+
+    def test_format_record_line_field_specs(self):
+        """Test record formatting with a list of field specifications."""
+        record = Valoracion(signo="N", importe=Decimal("12.34"))
+        field_specs = [FieldSpec("signo", 1, 3, "str")]
+        result = self.parser._format_record_line(record, field_specs)
+        self.assertEqual(result, "N".ljust(500))
+
 
 class TestCSVRoundTrip(unittest.TestCase):
     """Test CSV reading and writing."""
@@ -220,6 +251,23 @@ tipo_registro,modelo,ejercicio,nif_declarante,nif_declarado,nif_representante,no
         self.assertEqual(len(declaration.detalles), 1)
         self.assertEqual(declaration.detalles[0].clave_tipo_bien, ClaveBien.C)
 
+    def test_csv_read_missing_section(self):
+        """Test CSV reading fails without the DETALLES section."""
+        content = self.csv_content.split("__SECTION__,DETALLES")[0]
+        with open("temp_test.csv", "w", encoding="utf-8") as f:
+            f.write(content)
+
+        try:
+            with self.assertRaises(CSV720Error) as cm:
+                self.parser.read_csv("temp_test.csv")
+        finally:
+            import os
+
+            if os.path.exists("temp_test.csv"):
+                os.remove("temp_test.csv")
+
+        self.assertIn("Missing __SECTION__ markers", str(cm.exception))
+
 
 if __name__ == "__main__":
     unittest.main()